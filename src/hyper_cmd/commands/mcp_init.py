@@ -1,13 +1,33 @@
 """MCP initialization command for setting up .mcp.json configuration."""
 
+import functools
 import json
 import os
-import shutil
+import re
+import stat
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, cast
 
 from .base import BaseCommand
 
+# Digit runs this long may be integers outside orjson's 64-bit range, which it
+# would silently read back as floats
+_LONG_DIGIT_RUN = re.compile(rb"\d{19,}")
+
+# Answers recognized at confirmation prompts (already stripped and lower-cased)
+_YES_ANSWERS = frozenset({"y", "yes"})
+_NO_ANSWERS = frozenset({"n", "no"})
+
+
+@functools.cache
+def _orjson() -> Any:
+    """Import the optional orjson backend on first use, or return None if missing."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
 
 class MCPConfigGenerator:
     """Generates MCP configuration for Hyper CLI integration."""
@@ -15,6 +35,9 @@ class MCPConfigGenerator:
     # MCP schema URL for validation
     MCP_SCHEMA_URL = "https://raw.githubusercontent.com/modelcontextprotocol/specification/main/schema/mcp_config.schema.json"
 
+    # Configs at least this large are memory-mapped instead of read into a buffer
+    MMAP_READ_THRESHOLD = 64 * 1024
+
     @classmethod
     def generate_config(cls) -> dict[str, Any]:
         """Generate the standard MCP configuration for Hyper CLI."""
@@ -39,11 +62,35 @@ class MCPConfigGenerator:
             return {}
 
         try:
+            orjson = _orjson()
+            if orjson is not None:
+                return cls._read_config_orjson(orjson, config_file)
             with open(config_file, encoding="utf-8") as f:
                 return json.load(f)
         except (json.JSONDecodeError, OSError) as e:
             raise ValueError(f"Failed to read existing config: {e}") from e
 
+    @classmethod
+    def _read_config_orjson(cls, orjson: Any, config_file: Path) -> dict[str, Any]:
+        """Parse a config file with orjson, memory-mapping large files."""
+        import mmap
+
+        with open(config_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size < cls.MMAP_READ_THRESHOLD:
+                return cls._loads_orjson(orjson, f.read())
+
+            # Hand orjson the mapped pages directly instead of copying them first
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return cls._loads_orjson(orjson, view)
+
+    @staticmethod
+    def _loads_orjson(orjson: Any, data: Any) -> dict[str, Any]:
+        """Parse JSON bytes with orjson, using json when integers could lose precision."""
+        if _LONG_DIGIT_RUN.search(data):
+            return cast(dict[str, Any], json.loads(bytes(data)))
+        return cast(dict[str, Any], orjson.loads(data))
+
     @classmethod
     def merge_config(
         cls, existing_config: dict[str, Any], new_config: dict[str, Any]
@@ -52,35 +99,81 @@ class MCPConfigGenerator:
         if not existing_config:
             return new_config
 
-        # Start with existing config
-        merged = existing_config.copy()
+        # Start with existing config, leaving the input untouched, and build the
+        # merged server table (adding or updating hyper-cmd) in one pass
+        merged = {
+            **existing_config,
+            "mcpServers": {**existing_config.get("mcpServers", {}), **new_config["mcpServers"]},
+        }
+
+        cls._merge_metadata(merged, new_config)
+        return merged
 
-        # Ensure mcpServers exists
-        if "mcpServers" not in merged:
-            merged["mcpServers"] = {}
+    @classmethod
+    def merge_config_inplace(
+        cls, existing_config: dict[str, Any], new_config: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Merge new configuration into an existing one without copying it.
 
+        Unlike merge_config(), this modifies and returns existing_config; use it
+        only when the caller owns the existing config (e.g. just read from disk).
+        """
         # Add or update hyper-cmd server
-        merged["mcpServers"].update(new_config["mcpServers"])
+        existing_config.setdefault("mcpServers", {}).update(new_config["mcpServers"])
+
+        cls._merge_metadata(existing_config, new_config)
+        return existing_config
 
-        # Update schema and version if they exist in new config
+    @staticmethod
+    def _merge_metadata(config: dict[str, Any], new_config: dict[str, Any]) -> None:
+        """Update schema and version in config if they exist in new config."""
         if "$schema" in new_config:
-            merged["$schema"] = new_config["$schema"]
+            config["$schema"] = new_config["$schema"]
         if "version" in new_config:
-            merged["version"] = new_config["version"]
-
-        return merged
+            config["version"] = new_config["version"]
 
     @classmethod
     def write_config(cls, config_file: Path, config: dict[str, Any]) -> None:
         """Write MCP configuration to file with proper formatting."""
-        with open(config_file, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
-            f.write("\n")  # Add trailing newline
+        # Serialize up front so the file sees a single write (with trailing newline)
+        content = None
+        orjson = _orjson()
+        if orjson is not None:
+            try:
+                content = orjson.dumps(
+                    config, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+                )
+            except orjson.JSONEncodeError:
+                pass  # e.g. integers beyond 64 bits, which the json module handles
+        if content is None:
+            content = (json.dumps(config, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+        with open(config_file, "wb") as f:
+            f.write(content)
 
 
 class MCPToolDetector:
     """Detects MCP-compatible tools and existing configurations."""
 
+    # Common MCP config locations, relative to the home and current directories
+    HOME_CONFIG_PATHS = (".config/claude-code/mcp.json", ".claude/mcp.json")
+    CWD_CONFIG_PATHS = ("mcp.json", ".mcp.json")
+
+    # uvx locations found so far, keyed by PATH (misses are not cached)
+    _uvx_paths: dict[Optional[str], str] = {}
+
+    @classmethod
+    def find_uvx(cls) -> Optional[str]:
+        """Locate the uvx executable, reusing earlier lookups for the same PATH."""
+        path_env = os.environ.get("PATH")
+        uvx = cls._uvx_paths.get(path_env)
+        if uvx is None:
+            import shutil
+
+            uvx = shutil.which("uvx", path=path_env)
+            if uvx:
+                cls._uvx_paths[path_env] = uvx
+        return uvx
+
     @classmethod
     def detect_tools(cls) -> list[str]:
         """Detect common MCP-compatible tools in the environment."""
@@ -100,15 +193,14 @@ class MCPToolDetector:
     @classmethod
     def _find_existing_configs(cls) -> list[Path]:
         """Find existing MCP configuration files."""
-        home = Path.home()
-        common_configs = [
-            home / ".config" / "claude-code" / "mcp.json",
-            home / ".claude" / "mcp.json",
-            Path.cwd() / "mcp.json",
-            Path.cwd() / ".mcp.json",
-        ]
+        search_paths = ((Path.home(), cls.HOME_CONFIG_PATHS), (Path.cwd(), cls.CWD_CONFIG_PATHS))
 
-        return [p for p in common_configs if p.exists()]
+        return [
+            path
+            for base, relative_paths in search_paths
+            for relative_path in relative_paths
+            if (path := base / relative_path).exists()
+        ]
 
 
 class McpInitCommand(BaseCommand):
@@ -174,7 +266,7 @@ class McpInitCommand(BaseCommand):
             Exit code (0 for success, non-zero for failure)
         """
         # Check if uvx is available first
-        if not shutil.which("uvx"):
+        if not self.tool_detector.find_uvx():
             self.print_error("uvx is required but not found in PATH")
             self.console.print(
                 "\n[bold red]Error:[/bold red] uvx is not installed or not available"
@@ -202,11 +294,12 @@ class McpInitCommand(BaseCommand):
             new_config = self.config_generator.generate_config()
             if merge_strategy == "merge":
                 existing_config = self.config_generator.read_config(config_file)
-                config = self.config_generator.merge_config(existing_config, new_config)
-                self._show_merge_preview(existing_config, config, config_file)
+                existing_servers = list(existing_config.get("mcpServers", {}))
+                config = self.config_generator.merge_config_inplace(existing_config, new_config)
+                self._show_merge_preview(existing_servers, config, config_file, force)
             else:
                 config = new_config
-                self._show_config_preview(config, config_file)
+                self._show_config_preview(config, config_file, force)
 
             # Get final confirmation if not using force
             if not force and not self._confirm_proceed():
@@ -227,21 +320,24 @@ class McpInitCommand(BaseCommand):
 
     def _determine_config_file(self, config_path: Optional[str]) -> Optional[Path]:
         """Determine and validate the config file location."""
+        # Work on plain strings until validated to avoid intermediate Path objects
         if config_path:
-            config_dir = Path(config_path).resolve()
+            config_dir = os.path.realpath(config_path)
         else:
-            config_dir = Path.cwd()
+            config_dir = os.getcwd()
 
-        # Validate directory
-        if not config_dir.exists():
+        # Validate directory with a single stat call
+        try:
+            mode = os.stat(config_dir).st_mode
+        except (OSError, ValueError):
             self.print_error(f"Directory does not exist: {config_dir}")
             return None
 
-        if not config_dir.is_dir():
+        if not stat.S_ISDIR(mode):
             self.print_error(f"Path is not a directory: {config_dir}")
             return None
 
-        return config_dir / ".mcp.json"
+        return Path(config_dir) / ".mcp.json"
 
     def _determine_merge_strategy(self, config_file: Path, force: bool) -> Optional[str]:
         """Determine how to handle existing configuration file.
@@ -287,56 +383,61 @@ class McpInitCommand(BaseCommand):
             self.print_warning("File appears to be invalid JSON")
             return self._confirm_overwrite_strategy()
 
-    def _prompt_merge_strategy(self, has_hyper_cmd: bool) -> Optional[str]:
-        """Prompt user to choose merge strategy when other servers exist."""
-        try:
-            if has_hyper_cmd:
-                self.console.print("\nOptions:")
-                self.console.print("  [1] Merge - Update hyper-cmd server, keep other servers")
-                self.console.print("  [2] Overwrite - Replace entire file with only hyper-cmd")
-                self.console.print("  [3] Cancel")
-
-                while True:
-                    response = input("Choose option [1/2/3]: ").strip()
-                    if response == "1":
-                        return "merge"
-                    elif response == "2":
-                        return "overwrite"
-                    elif response == "3":
-                        return None
-                    else:
-                        self.print_error("Please enter 1, 2, or 3")
-            else:
-                self.console.print("\nOptions:")
-                self.console.print("  [1] Merge - Add hyper-cmd server, keep existing servers")
-                self.console.print("  [2] Overwrite - Replace entire file with only hyper-cmd")
-                self.console.print("  [3] Cancel")
-
-                while True:
-                    response = input("Choose option [1/2/3]: ").strip()
-                    if response == "1":
-                        return "merge"
-                    elif response == "2":
-                        return "overwrite"
-                    elif response == "3":
-                        return None
-                    else:
-                        self.print_error("Please enter 1, 2, or 3")
+    def _prompt(self, message: str) -> Optional[str]:
+        """Read one normalized answer from the user.
 
+        Returns:
+            The stripped, lower-cased response, or None if input was interrupted
+        """
+        try:
+            return input(message).strip().lower()
         except (EOFError, KeyboardInterrupt):
             return None
 
+    def _prompt_merge_strategy(self, has_hyper_cmd: bool) -> Optional[str]:
+        """Prompt user to choose merge strategy when other servers exist."""
+        merge_action = "Update hyper-cmd server, keep other servers"
+        if not has_hyper_cmd:
+            merge_action = "Add hyper-cmd server, keep existing servers"
+
+        self.console.print("\nOptions:")
+        self.console.print(f"  [1] Merge - {merge_action}")
+        self.console.print("  [2] Overwrite - Replace entire file with only hyper-cmd")
+        self.console.print("  [3] Cancel")
+
+        while True:
+            response = self._prompt("Choose option [1/2/3]: ")
+            if response is None or response == "3":
+                return None
+            elif response == "1":
+                return "merge"
+            elif response == "2":
+                return "overwrite"
+            else:
+                self.print_error("Please enter 1, 2, or 3")
+
     def _confirm_overwrite_strategy(self) -> Optional[str]:
         """Ask user to confirm overwriting existing file."""
-        try:
-            response = input("Do you want to overwrite the existing .mcp.json file? [y/N]: ")
-            return "overwrite" if response.lower().startswith("y") else None
-        except (EOFError, KeyboardInterrupt):
-            return None
+        response = self._prompt("Do you want to overwrite the existing .mcp.json file? [y/N]: ")
+        return "overwrite" if response in _YES_ANSWERS else None
 
-    def _show_config_preview(self, config: dict[str, Any], config_file: Path) -> None:
-        """Show a preview of the configuration that will be created."""
+    def _show_config_preview(
+        self, config: dict[str, Any], config_file: Path, force: bool = False
+    ) -> None:
+        """Show a preview of the configuration that will be created.
+
+        Args:
+            config: Configuration that will be written
+            config_file: Path of the configuration file
+            force: Whether the file is written without asking for confirmation
+        """
         self.print_info(f"Creating MCP configuration at: {config_file}")
+
+        # Skip the detailed preview when nobody is watching (piped output, MCP calls)
+        # and no confirmation prompt follows
+        if force and not self.console.is_terminal:
+            return
+
         self.console.print("\n[bold]Configuration preview:[/bold]")
 
         # Show the important parts of the config
@@ -355,18 +456,34 @@ class McpInitCommand(BaseCommand):
         self.console.print("")
 
     def _show_merge_preview(
-        self, existing_config: dict[str, Any], merged_config: dict[str, Any], config_file: Path
+        self,
+        existing_servers: list[str],
+        merged_config: dict[str, Any],
+        config_file: Path,
+        force: bool = False,
     ) -> None:
-        """Show a preview of the merge operation."""
+        """Show a preview of the merge operation.
+
+        Args:
+            existing_servers: Names of the servers configured before the merge
+            merged_config: Configuration that will be written
+            config_file: Path of the configuration file
+            force: Whether the file is written without asking for confirmation
+        """
         self.print_info(f"Merging with existing MCP configuration at: {config_file}")
 
-        existing_servers = existing_config.get("mcpServers", {})
         merged_servers = merged_config.get("mcpServers", {})
 
+        # Summarize in one line when nobody is watching (piped output, MCP calls)
+        # and no confirmation prompt follows
+        if force and not self.console.is_terminal:
+            self.console.print(f"  Total servers after merge: {len(merged_servers)}")
+            return
+
         self.console.print("\n[bold]Merge preview:[/bold]")
 
         # Show existing servers that will be kept
-        kept_servers = [name for name in existing_servers.keys() if name != "hyper-cmd"]
+        kept_servers = [name for name in existing_servers if name != "hyper-cmd"]
         if kept_servers:
             self.console.print("  ✓ Keeping existing servers:")
             for server_name in kept_servers:
@@ -450,8 +567,6 @@ class McpInitCommand(BaseCommand):
 
     def _confirm_proceed(self) -> bool:
         """Ask user to confirm proceeding with MCP initialization."""
-        try:
-            response = input("Proceed with MCP configuration creation? [Y/n]: ")
-            return not response.lower().startswith("n")
-        except (EOFError, KeyboardInterrupt):
-            return False
+        response = self._prompt("Proceed with MCP configuration creation? [Y/n]: ")
+        # Only an explicit no declines; anything else takes the default answer (yes)
+        return response is not None and response not in _NO_ANSWERS
@@ -8,6 +8,7 @@ import inspect
 import json
 import sys
 import traceback
+from collections.abc import Iterator
 from typing import Any, Optional
 
 from .cli import discover_commands
@@ -357,6 +358,9 @@ class MCPServer:
         self.command_analyzer = MCPCommandAnalyzer(self.container, self.command_filter)
         self.command_executor = MCPCommandExecutor(self.container)
 
+        # Tool schemas keyed by tool name, built on first use
+        self._tools_by_name: Optional[dict[str, dict[str, Any]]] = None
+
     def _initialize_plugins(self) -> None:
         """Initialize the plugin registry."""
         # Use force_reinitialize to avoid warning when already initialized
@@ -397,8 +401,31 @@ class MCPServer:
 
     def get_tools(self) -> list[dict[str, Any]]:
         """Get all available tools (commands) for MCP."""
-        tools = []
+        return list(self._get_tools_by_name().values())
+
+    def iter_tools(self) -> Iterator[dict[str, Any]]:
+        """Iterate over available tools, building schemas only as they are consumed.
+
+        Callers that stop early (e.g. when searching for one tool) skip analyzing the
+        remaining commands. Once all schemas have been built, they are reused.
+        """
+        if self._tools_by_name is not None:
+            yield from self._tools_by_name.values()
+        else:
+            yield from self._iter_tool_schemas()
+
+    def get_tool(self, tool_name: str) -> Optional[dict[str, Any]]:
+        """Get the schema of a single available tool, or None if it is not exposed."""
+        return self._get_tools_by_name().get(tool_name)
 
+    def _get_tools_by_name(self) -> dict[str, dict[str, Any]]:
+        """Get tool schemas keyed by tool name, building them once per server."""
+        if self._tools_by_name is None:
+            self._tools_by_name = {tool["name"]: tool for tool in self._iter_tool_schemas()}
+        return self._tools_by_name
+
+    def _iter_tool_schemas(self) -> Iterator[dict[str, Any]]:
+        """Yield tool schemas for all non-interactive commands in the registry."""
         for cmd_name in self.registry.list_commands():
             cmd_class = self.registry.get(cmd_name)
             if not cmd_class:
@@ -410,9 +437,7 @@ class MCPServer:
 
             tool_schema = self.command_analyzer.get_tool_schema(cmd_name, cmd_class)
             if tool_schema:
-                tools.append(tool_schema)
-
-        return tools
+                yield tool_schema
 
     def execute_tool(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         """Execute a tool (command) with given arguments."""
@@ -565,11 +590,16 @@ class MCPServer:
             return {"jsonrpc": "2.0", "id": request_id, "result": result}
 
         except Exception as e:
-            return {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "error": {"code": -32603, "message": f"Internal error: {str(e)}"},
-            }
+            return self._error_response(request_id, -32603, f"Internal error: {str(e)}")
+
+    @staticmethod
+    def _error_response(request_id: Any, code: int, message: str) -> dict[str, Any]:
+        """Build a JSON-RPC error response."""
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {"code": code, "message": message},
+        }
 
     def _route_request(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
         """Route request to appropriate handler method."""
@@ -603,18 +633,10 @@ class MCPServer:
                 response = self.handle_request(request)
                 print(json.dumps(response), flush=True)
             except json.JSONDecodeError:
-                error_response = {
-                    "jsonrpc": "2.0",
-                    "id": None,
-                    "error": {"code": -32700, "message": "Parse error"},
-                }
+                error_response = self._error_response(None, -32700, "Parse error")
                 print(json.dumps(error_response), flush=True)
             except Exception as e:
-                error_response = {
-                    "jsonrpc": "2.0",
-                    "id": None,
-                    "error": {"code": -32603, "message": f"Internal error: {str(e)}"},
-                }
+                error_response = self._error_response(None, -32603, f"Internal error: {str(e)}")
                 print(json.dumps(error_response), flush=True)
 
 
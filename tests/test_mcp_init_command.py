@@ -1,16 +1,25 @@
 """Comprehensive tests for init-mcp command functionality."""
 
+import io
 import json
-import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+from rich.console import Console
 
 from hyper_cmd.commands.mcp_init import MCPConfigGenerator, McpInitCommand, MCPToolDetector
 from hyper_cmd.container.simple_container import SimpleContainer
 
 
+@pytest.fixture(autouse=True)
+def clear_uvx_cache():
+    """Keep uvx lookups (including patched ones) from leaking between tests."""
+    MCPToolDetector._uvx_paths.clear()
+    yield
+    MCPToolDetector._uvx_paths.clear()
+
+
 class TestMCPConfigGenerator:
     """Test the MCP configuration generator."""
 
@@ -32,57 +41,96 @@ class TestMCPConfigGenerator:
         assert hyper_config["env"] == {}
         assert "description" in hyper_config
 
-    def test_write_config(self):
+    def test_generate_config_returns_independent_copies(self):
+        """Test that generated configs can be modified without affecting later calls."""
+        config = MCPConfigGenerator.generate_config()
+        config["mcpServers"]["hyper-cmd"]["env"]["FOO"] = "bar"
+
+        assert MCPConfigGenerator.generate_config()["mcpServers"]["hyper-cmd"]["env"] == {}
+
+    def test_write_config(self, tmp_path):
         """Test configuration file writing."""
         config = MCPConfigGenerator.generate_config()
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_file = Path(tmp_dir) / "test.json"
+        config_file = tmp_path / "test.json"
+
+        MCPConfigGenerator.write_config(config_file, config)
+
+        # Verify file was created
+        assert config_file.exists()
+
+        # Verify content
+        with open(config_file) as f:
+            written_config = json.load(f)
 
+        assert written_config == config
+
+        # Verify proper formatting (should end with newline)
+        with open(config_file) as f:
+            content = f.read()
+        assert content.endswith("\n")
+
+    def test_write_and_read_config_without_orjson(self, tmp_path):
+        """Test the stdlib json fallback produces the same file contents."""
+        config = MCPConfigGenerator.generate_config()
+        config_file = tmp_path / ".mcp.json"
+
+        with patch("hyper_cmd.commands.mcp_init._orjson", return_value=None):
             MCPConfigGenerator.write_config(config_file, config)
+            assert MCPConfigGenerator.read_config(config_file) == config
 
-            # Verify file was created
-            assert config_file.exists()
+        assert config_file.read_text(encoding="utf-8") == json.dumps(config, indent=2) + "\n"
 
-            # Verify content
-            with open(config_file) as f:
-                written_config = json.load(f)
+    def test_write_and_read_config_large_integers(self, tmp_path):
+        """Test integers beyond 64 bits survive a round trip with either backend."""
+        config = {"mcpServers": {}, "big": 123456789012345678901234567890, "neg": -(2**63) - 1}
+        config_file = tmp_path / ".mcp.json"
 
-            assert written_config == config
+        MCPConfigGenerator.write_config(config_file, config)
+        result = MCPConfigGenerator.read_config(config_file)
 
-            # Verify proper formatting (should end with newline)
-            with open(config_file) as f:
-                content = f.read()
-            assert content.endswith("\n")
+        assert result == config
+        assert isinstance(result["big"], int)
 
-    def test_read_config_nonexistent_file(self):
+    def test_read_config_nonexistent_file(self, tmp_path):
         """Test reading config from nonexistent file."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_file = Path(tmp_dir) / ".mcp.json"
+        config_file = tmp_path / ".mcp.json"
 
-            result = MCPConfigGenerator.read_config(config_file)
+        result = MCPConfigGenerator.read_config(config_file)
 
-            assert result == {}
+        assert result == {}
 
-    def test_read_config_existing_file(self):
+    def test_read_config_existing_file(self, tmp_path):
         """Test reading config from existing file."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_file = Path(tmp_dir) / ".mcp.json"
-            test_config = {"mcpServers": {"test": {"command": "test"}}}
+        config_file = tmp_path / ".mcp.json"
+        test_config = {"mcpServers": {"test": {"command": "test"}}}
 
-            with open(config_file, "w") as f:
-                json.dump(test_config, f)
+        with open(config_file, "w") as f:
+            json.dump(test_config, f)
 
-            result = MCPConfigGenerator.read_config(config_file)
+        result = MCPConfigGenerator.read_config(config_file)
 
-            assert result == test_config
+        assert result == test_config
 
-    def test_read_config_invalid_json(self):
+    def test_read_config_invalid_json(self, tmp_path):
         """Test reading config from file with invalid JSON."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_file = Path(tmp_dir) / ".mcp.json"
-            config_file.write_text("invalid json")
+        config_file = tmp_path / ".mcp.json"
+        config_file.write_text("invalid json")
 
+        with pytest.raises(ValueError, match="Failed to read existing config"):
+            MCPConfigGenerator.read_config(config_file)
+
+    def test_read_config_memory_mapped(self, tmp_path):
+        """Test reading a config above the memory-map threshold."""
+        pytest.importorskip("orjson")
+        config_file = tmp_path / ".mcp.json"
+        test_config = {"mcpServers": {f"server-{i}": {"command": "test"} for i in range(100)}}
+        config_file.write_text(json.dumps(test_config))
+
+        with patch.object(MCPConfigGenerator, "MMAP_READ_THRESHOLD", 1):
+            assert MCPConfigGenerator.read_config(config_file) == test_config
+
+            config_file.write_text("invalid json")
             with pytest.raises(ValueError, match="Failed to read existing config"):
                 MCPConfigGenerator.read_config(config_file)
 
@@ -131,20 +179,91 @@ class TestMCPConfigGenerator:
         # Should keep other server
         assert "other-server" in result["mcpServers"]
 
-    def test_show_merge_preview(self):
+    def test_merge_config_does_not_modify_existing(self):
+        """Test that merging leaves the existing config untouched."""
+        existing_config = {"mcpServers": {"other-server": {"command": "other", "args": []}}}
+        new_config = MCPConfigGenerator.generate_config()
+
+        MCPConfigGenerator.merge_config(existing_config, new_config)
+
+        assert existing_config == {"mcpServers": {"other-server": {"command": "other", "args": []}}}
+
+    def test_merge_config_inplace(self):
+        """Test merging into an existing config in place."""
+        existing_config = {
+            "mcpServers": {"other-server": {"command": "other", "args": []}},
+            "version": "0.9",
+        }
+        new_config = MCPConfigGenerator.generate_config()
+
+        result = MCPConfigGenerator.merge_config_inplace(existing_config, new_config)
+
+        assert result is existing_config
+        assert set(result["mcpServers"]) == {"other-server", "hyper-cmd"}
+        assert result["version"] == "1.0"
+        assert result["$schema"] == MCPConfigGenerator.MCP_SCHEMA_URL
+
+    def test_merge_config_inplace_empty_existing(self):
+        """Test merging in place into an empty config."""
+        new_config = MCPConfigGenerator.generate_config()
+
+        result = MCPConfigGenerator.merge_config_inplace({}, new_config)
+
+        assert result["mcpServers"] == new_config["mcpServers"]
+
+    def test_show_merge_preview(self, tmp_path):
         """Test merge preview display."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_file = Path(tmp_dir) / ".mcp.json"
+        config_file = tmp_path / ".mcp.json"
+
+        existing_config = {"mcpServers": {"other-server": {"command": "other"}}}
+        new_config = MCPConfigGenerator.generate_config()
+        merged_config = MCPConfigGenerator.merge_config(existing_config, new_config)
+
+        # Create a command instance for testing
+        command = McpInitCommand()
+        command.console = Console(file=io.StringIO(), force_terminal=True)
+
+        command._show_merge_preview(list(existing_config["mcpServers"]), merged_config, config_file)
+
+        output = command.console.file.getvalue()
+        assert "Merge preview" in output
+        assert "other-server" in output
+
+    def test_show_merge_preview_not_a_terminal_with_prompt(self, tmp_path):
+        """Test full merge preview is kept off a terminal when a confirmation follows."""
+        config_file = tmp_path / ".mcp.json"
+
+        existing_config = {"mcpServers": {"other-server": {"command": "other"}}}
+        new_config = MCPConfigGenerator.generate_config()
+        merged_config = MCPConfigGenerator.merge_config(existing_config, new_config)
+
+        command = McpInitCommand()
+        command.console = Console(file=io.StringIO(), force_terminal=False)
+
+        command._show_merge_preview(list(existing_config["mcpServers"]), merged_config, config_file)
 
-            existing_config = {"mcpServers": {"other-server": {"command": "other"}}}
-            new_config = MCPConfigGenerator.generate_config()
-            merged_config = MCPConfigGenerator.merge_config(existing_config, new_config)
+        output = command.console.file.getvalue()
+        assert "Merge preview" in output
+        assert "other-server" in output
 
-            # Create a command instance for testing
-            command = McpInitCommand()
+    def test_show_merge_preview_not_a_terminal(self, tmp_path):
+        """Test merge preview is reduced to a summary when output is not a terminal."""
+        config_file = tmp_path / ".mcp.json"
 
-            # Should not raise an exception
-            command._show_merge_preview(existing_config, merged_config, config_file)
+        existing_config = {"mcpServers": {"other-server": {"command": "other"}}}
+        new_config = MCPConfigGenerator.generate_config()
+        merged_config = MCPConfigGenerator.merge_config(existing_config, new_config)
+
+        command = McpInitCommand()
+        command.console = Console(file=io.StringIO(), force_terminal=False)
+
+        command._show_merge_preview(
+            list(existing_config["mcpServers"]), merged_config, config_file, force=True
+        )
+
+        output = command.console.file.getvalue()
+        assert "Merge preview" not in output
+        assert "Total servers after merge: 2" in output
 
 
 class TestMCPToolDetector:
@@ -173,21 +292,36 @@ class TestMCPToolDetector:
                 tools = MCPToolDetector.detect_tools()
                 assert any("Existing MCP configs" in tool for tool in tools)
 
-    def test_find_existing_configs(self):
+    def test_find_existing_configs(self, tmp_path):
         """Test finding existing configuration files."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            # Create a mock config file
-            config_file = Path(tmp_dir) / ".mcp.json"
-            config_file.write_text('{"test": true}')
+        # Create a mock config file
+        config_file = tmp_path / ".mcp.json"
+        config_file.write_text('{"test": true}')
+
+        # Mock Path.cwd() to return our temp directory
+        with patch("pathlib.Path.cwd", return_value=tmp_path):
+            # Mock Path.home() to return temp directory (to avoid real home)
+            with patch("pathlib.Path.home", return_value=tmp_path):
+                configs = MCPToolDetector._find_existing_configs()
+
+                # Should find our config file
+                assert any(config_file.name in str(config) for config in configs)
+
+    def test_find_uvx_caches_hits(self):
+        """Test that a found uvx path is reused for the same PATH."""
+        with patch("shutil.which", return_value="/usr/bin/uvx") as mock_which:
+            assert MCPToolDetector.find_uvx() == "/usr/bin/uvx"
+            assert MCPToolDetector.find_uvx() == "/usr/bin/uvx"
+
+        assert mock_which.call_count == 1
 
-            # Mock Path.cwd() to return our temp directory
-            with patch("pathlib.Path.cwd", return_value=Path(tmp_dir)):
-                # Mock Path.home() to return temp directory (to avoid real home)
-                with patch("pathlib.Path.home", return_value=Path(tmp_dir)):
-                    configs = MCPToolDetector._find_existing_configs()
+    def test_find_uvx_does_not_cache_misses(self):
+        """Test that a missing uvx is looked up again on the next call."""
+        with patch("shutil.which", return_value=None) as mock_which:
+            assert MCPToolDetector.find_uvx() is None
+            assert MCPToolDetector.find_uvx() is None
 
-                    # Should find our config file
-                    assert any(config_file.name in str(config) for config in configs)
+        assert mock_which.call_count == 2
 
 
 class TestMcpInitCommand:
@@ -212,44 +346,42 @@ class TestMcpInitCommand:
         assert isinstance(self.command.help_text, str)
         assert "init-mcp" in self.command.help_text
 
-    def test_execute_success_force(self):
+    def test_execute_success_force(self, tmp_path):
         """Test successful execution with force flag."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            exit_code = self.command.execute(force=True, config_path=tmp_dir)
+        exit_code = self.command.execute(force=True, config_path=str(tmp_path))
 
-            assert exit_code == 0
+        assert exit_code == 0
 
-            # Verify config file was created
-            config_file = Path(tmp_dir) / ".mcp.json"
-            assert config_file.exists()
+        # Verify config file was created
+        config_file = tmp_path / ".mcp.json"
+        assert config_file.exists()
 
-            # Verify config content
-            with open(config_file) as f:
-                config = json.load(f)
+        # Verify config content
+        with open(config_file) as f:
+            config = json.load(f)
 
-            assert "mcpServers" in config
-            assert "hyper-cmd" in config["mcpServers"]
+        assert "mcpServers" in config
+        assert "hyper-cmd" in config["mcpServers"]
 
-    def test_execute_current_directory(self):
+    def test_execute_current_directory(self, tmp_path):
         """Test execution in current directory."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            # Change to temp directory
-            import os
+        # Change to temp directory
+        import os
 
-            old_cwd = os.getcwd()
-            try:
-                os.chdir(tmp_dir)
+        old_cwd = os.getcwd()
+        try:
+            os.chdir(tmp_path)
 
-                exit_code = self.command.execute(force=True)
+            exit_code = self.command.execute(force=True)
 
-                assert exit_code == 0
+            assert exit_code == 0
 
-                # Verify config file was created in current directory
-                config_file = Path(tmp_dir) / ".mcp.json"
-                assert config_file.exists()
+            # Verify config file was created in current directory
+            config_file = tmp_path / ".mcp.json"
+            assert config_file.exists()
 
-            finally:
-                os.chdir(old_cwd)
+        finally:
+            os.chdir(old_cwd)
 
     def test_execute_invalid_directory(self):
         """Test execution with invalid directory."""
@@ -257,21 +389,22 @@ class TestMcpInitCommand:
 
         assert exit_code == 1
 
-    def test_execute_file_as_directory(self):
+    def test_execute_file_as_directory(self, tmp_path):
         """Test execution with file path instead of directory."""
-        with tempfile.NamedTemporaryFile() as tmp_file:
-            exit_code = self.command.execute(force=True, config_path=tmp_file.name)
+        tmp_file = tmp_path / "not_a_dir"
+        tmp_file.write_text("")
 
-            assert exit_code == 1
+        exit_code = self.command.execute(force=True, config_path=str(tmp_file))
+
+        assert exit_code == 1
 
-    def test_determine_config_file_valid(self):
+    def test_determine_config_file_valid(self, tmp_path):
         """Test config file location determination."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_file = self.command._determine_config_file(tmp_dir)
+        config_file = self.command._determine_config_file(str(tmp_path))
 
-            assert config_file is not None
-            assert config_file.name == ".mcp.json"
-            assert str(tmp_dir) in str(config_file.parent)
+        assert config_file is not None
+        assert config_file.name == ".mcp.json"
+        assert str(tmp_path) in str(config_file.parent)
 
     def test_determine_config_file_invalid(self):
         """Test config file determination with invalid path."""
@@ -279,67 +412,92 @@ class TestMcpInitCommand:
 
         assert config_file is None
 
-    def test_determine_merge_strategy_no_file(self):
+    def test_determine_merge_strategy_no_file(self, tmp_path):
         """Test merge strategy when no existing file."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_file = Path(tmp_dir) / ".mcp.json"
+        config_file = tmp_path / ".mcp.json"
 
-            result = self.command._determine_merge_strategy(config_file, force=False)
+        result = self.command._determine_merge_strategy(config_file, force=False)
 
-            assert result == "overwrite"
+        assert result == "overwrite"
 
-    def test_determine_merge_strategy_with_force(self):
+    def test_determine_merge_strategy_with_force(self, tmp_path):
         """Test merge strategy with force flag."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_file = Path(tmp_dir) / ".mcp.json"
-            config_file.write_text('{"mcpServers": {"other": {}}}')
+        config_file = tmp_path / ".mcp.json"
+        config_file.write_text('{"mcpServers": {"other": {}}}')
 
-            result = self.command._determine_merge_strategy(config_file, force=True)
+        result = self.command._determine_merge_strategy(config_file, force=True)
 
-            assert result == "overwrite"
+        assert result == "overwrite"
 
-    def test_determine_merge_strategy_with_other_servers(self):
+    def test_determine_merge_strategy_with_other_servers(self, tmp_path):
         """Test merge strategy when other servers exist."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_file = Path(tmp_dir) / ".mcp.json"
-            config_file.write_text('{"mcpServers": {"other-server": {"command": "other"}}}')
-
-            # Mock user input to select merge
-            with patch("builtins.input", return_value="1"):
-                result = self.command._determine_merge_strategy(config_file, force=False)
-                assert result == "merge"
-
-            # Mock user input to select overwrite
-            with patch("builtins.input", return_value="2"):
-                result = self.command._determine_merge_strategy(config_file, force=False)
-                assert result == "overwrite"
-
-            # Mock user input to cancel
-            with patch("builtins.input", return_value="3"):
-                result = self.command._determine_merge_strategy(config_file, force=False)
-                assert result is None
-
-    def test_show_config_preview(self):
+        config_file = tmp_path / ".mcp.json"
+        config_file.write_text('{"mcpServers": {"other-server": {"command": "other"}}}')
+
+        # Mock user input to select merge
+        with patch("builtins.input", return_value="1"):
+            result = self.command._determine_merge_strategy(config_file, force=False)
+            assert result == "merge"
+
+        # Mock user input to select overwrite
+        with patch("builtins.input", return_value="2"):
+            result = self.command._determine_merge_strategy(config_file, force=False)
+            assert result == "overwrite"
+
+        # Mock user input to cancel
+        with patch("builtins.input", return_value="3"):
+            result = self.command._determine_merge_strategy(config_file, force=False)
+            assert result is None
+
+    def test_show_config_preview(self, tmp_path):
         """Test configuration preview display."""
         config = MCPConfigGenerator.generate_config()
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_file = Path(tmp_dir) / ".mcp.json"
+        config_file = tmp_path / ".mcp.json"
+        self.command.console = Console(file=io.StringIO(), force_terminal=True)
 
-            # Should not raise an exception
-            self.command._show_config_preview(config, config_file)
+        self.command._show_config_preview(config, config_file)
 
-    def test_write_config_file_success(self):
+        output = self.command.console.file.getvalue()
+        assert "Configuration preview" in output
+        assert "hyper-cmd" in output
+
+    def test_show_config_preview_not_a_terminal_with_prompt(self, tmp_path):
+        """Test full configuration preview is kept off a terminal when a confirmation follows."""
+        config = MCPConfigGenerator.generate_config()
+        config_file = tmp_path / ".mcp.json"
+        self.command.console = Console(file=io.StringIO(), force_terminal=False)
+
+        self.command._show_config_preview(config, config_file)
+
+        output = self.command.console.file.getvalue()
+        assert "Configuration preview" in output
+        assert "hyper-cmd" in output
+
+    def test_show_config_preview_not_a_terminal(self, tmp_path):
+        """Test configuration preview is skipped when output is not a terminal."""
+        config = MCPConfigGenerator.generate_config()
+        config_file = tmp_path / ".mcp.json"
+        self.command.console = Console(file=io.StringIO(), force_terminal=False)
+
+        with patch.object(MCPToolDetector, "detect_tools") as mock_detect:
+            self.command._show_config_preview(config, config_file, force=True)
+
+        output = self.command.console.file.getvalue()
+        assert "Creating MCP configuration" in output
+        assert "Configuration preview" not in output
+        mock_detect.assert_not_called()
+
+    def test_write_config_file_success(self, tmp_path):
         """Test successful config file writing."""
         config = MCPConfigGenerator.generate_config()
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_file = Path(tmp_dir) / ".mcp.json"
+        config_file = tmp_path / ".mcp.json"
 
-            # Should not raise an exception
-            self.command._write_config_file(config_file, config)
+        # Should not raise an exception
+        self.command._write_config_file(config_file, config)
 
-            assert config_file.exists()
+        assert config_file.exists()
 
     def test_write_config_file_permission_error(self):
         """Test config file writing with permission error."""
@@ -371,6 +529,14 @@ class TestMcpInitCommand:
             result = self.command._confirm_overwrite_strategy()
             assert result is None
 
+    def test_prompt_normalizes_response(self):
+        """Test that prompt responses are stripped and lower-cased."""
+        with patch("builtins.input", return_value="  YES \n"):
+            assert self.command._prompt("Question? ") == "yes"
+
+        with patch("builtins.input", side_effect=EOFError()):
+            assert self.command._prompt("Question? ") is None
+
     def test_confirm_overwrite_strategy_interrupt(self):
         """Test overwrite strategy confirmation with interrupt."""
         with patch("builtins.input", side_effect=KeyboardInterrupt()):
@@ -401,6 +567,19 @@ class TestMcpInitCommand:
             result = self.command._confirm_proceed()
             assert result is False
 
+    def test_confirm_overwrite_strategy_unrecognized_answer(self):
+        """Test that only explicit yes answers confirm an overwrite."""
+        for answer in ("yellow", "yeah"):
+            with patch("builtins.input", return_value=answer):
+                assert self.command._confirm_overwrite_strategy() is None
+
+    def test_confirm_proceed_unrecognized_answer(self):
+        """Test that unrecognized answers take the default without asking again."""
+        for answer in ("sure", "nope"):
+            with patch("builtins.input", return_value=answer) as mock_input:
+                assert self.command._confirm_proceed() is True
+            mock_input.assert_called_once()
+
     def test_confirm_proceed_interrupt(self):
         """Test proceed confirmation with interrupt."""
         with patch("builtins.input", side_effect=KeyboardInterrupt()):
@@ -411,37 +590,35 @@ class TestMcpInitCommand:
             result = self.command._confirm_proceed()
             assert result is False
 
-    def test_execute_with_confirmation_flow(self):
+    def test_execute_with_confirmation_flow(self, tmp_path):
         """Test execution with user confirmation flow."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            # Create existing file
-            config_file = Path(tmp_dir) / ".mcp.json"
-            config_file.write_text('{"existing": true}')
+        # Create existing file
+        config_file = tmp_path / ".mcp.json"
+        config_file.write_text('{"existing": true}')
 
-            # Mock user to accept overwrite and proceed
-            with patch("builtins.input", side_effect=["y", "y"]):
-                exit_code = self.command.execute(force=False, config_path=tmp_dir)
+        # Mock user to accept overwrite and proceed
+        with patch("builtins.input", side_effect=["y", "y"]):
+            exit_code = self.command.execute(force=False, config_path=str(tmp_path))
 
-                assert exit_code == 0
+            assert exit_code == 0
 
-                # Verify new config was written
-                with open(config_file) as f:
-                    config = json.load(f)
+            # Verify new config was written
+            with open(config_file) as f:
+                config = json.load(f)
 
-                assert "hyper-cmd" in config["mcpServers"]
+            assert "hyper-cmd" in config["mcpServers"]
 
-    def test_execute_with_cancellation(self):
+    def test_execute_with_cancellation(self, tmp_path):
         """Test execution cancelled by user."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            # Mock user to decline proceeding
-            with patch("builtins.input", return_value="n"):
-                exit_code = self.command.execute(force=False, config_path=tmp_dir)
+        # Mock user to decline proceeding
+        with patch("builtins.input", return_value="n"):
+            exit_code = self.command.execute(force=False, config_path=str(tmp_path))
 
-                assert exit_code == 1
+            assert exit_code == 1
 
-                # Verify no config file was created
-                config_file = Path(tmp_dir) / ".mcp.json"
-                assert not config_file.exists()
+            # Verify no config file was created
+            config_file = tmp_path / ".mcp.json"
+            assert not config_file.exists()
 
     def test_execute_exception_handling(self):
         """Test exception handling during execution."""
@@ -460,115 +637,114 @@ class TestMcpInitCommand:
 
             assert exit_code == 1
 
-    def test_execute_uvx_available(self):
+    def test_execute_uvx_available(self, tmp_path):
         """Test execution when uvx is available."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            with patch("shutil.which", return_value="/usr/bin/uvx"):
-                exit_code = self.command.execute(force=True, config_path=tmp_dir)
+        with patch("shutil.which", return_value="/usr/bin/uvx"):
+            exit_code = self.command.execute(force=True, config_path=str(tmp_path))
 
-                assert exit_code == 0
+            assert exit_code == 0
 
-    def test_show_next_steps(self):
+    def test_show_next_steps(self, tmp_path):
         """Test next steps display."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            config_file = Path(tmp_dir) / ".mcp.json"
+        config_file = tmp_path / ".mcp.json"
 
-            # Should not raise an exception
-            self.command._show_next_steps(config_file)
+        # Should not raise an exception
+        self.command._show_next_steps(config_file)
 
-    def test_integration_with_mcp_server(self):
+    def test_integration_with_mcp_server(self, tmp_path):
         """Test integration between mcp-init and MCP server."""
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            # Create config with mcp-init
-            exit_code = self.command.execute(force=True, config_path=tmp_dir)
-            assert exit_code == 0
+        # Create config with mcp-init
+        exit_code = self.command.execute(force=True, config_path=str(tmp_path))
+        assert exit_code == 0
 
-            # Verify config file
-            config_file = Path(tmp_dir) / ".mcp.json"
-            assert config_file.exists()
+        # Verify config file
+        config_file = tmp_path / ".mcp.json"
+        assert config_file.exists()
 
-            # Load and verify config structure matches MCP server expectations
-            with open(config_file) as f:
-                config = json.load(f)
+        # Load and verify config structure matches MCP server expectations
+        with open(config_file) as f:
+            config = json.load(f)
+
+        assert "mcpServers" in config
+        server_config = config["mcpServers"]["hyper-cmd"]
+        assert server_config["command"] == "uvx"
+
+        # Verify config has required fields for MCP
+        assert "$schema" in config
+        assert "version" in config
 
-            assert "mcpServers" in config
-            server_config = config["mcpServers"]["hyper-cmd"]
-            assert server_config["command"] == "uvx"
 
-            # Verify config has required fields for MCP
-            assert "$schema" in config
-            assert "version" in config
+@pytest.fixture(scope="module")
+def command_registry():
+    """Discover commands once for all integration tests in this module."""
+    from hyper_cmd.cli import discover_commands
+
+    return discover_commands()
+
+
+@pytest.fixture(scope="module")
+def mcp_server():
+    """Create a single MCP server shared by the integration tests in this module."""
+    from hyper_cmd.mcp_server import MCPServer
+
+    return MCPServer()
 
 
 class TestMCPInitIntegration:
     """Integration tests for mcp-init command."""
 
-    def test_command_available_in_registry(self):
+    def test_command_available_in_registry(self, command_registry):
         """Test that init-mcp command is properly registered."""
-        from hyper_cmd.cli import discover_commands
-
-        registry = discover_commands()
-        commands = registry.list_commands()
+        commands = command_registry.list_commands()
 
         assert "init-mcp" in commands
 
         # Test command can be retrieved and instantiated
-        cmd_class = registry.get("init-mcp")
+        cmd_class = command_registry.get("init-mcp")
         assert cmd_class is not None
 
         container = SimpleContainer()
         instance = cmd_class(container)
         assert instance.name == "init-mcp"
 
-    def test_command_available_via_mcp(self):
+    def test_command_available_via_mcp(self, mcp_server):
         """Test that init-mcp command is available via MCP server."""
-        from hyper_cmd.mcp_server import MCPServer
-
-        server = MCPServer()
-        tools = server.get_tools()
+        tool = mcp_server.get_tool("hyper_init-mcp")
 
         # Should find init-mcp tool
-        mcp_init_tools = [tool for tool in tools if tool["name"] == "hyper_init-mcp"]
-        assert len(mcp_init_tools) == 1
-
-        tool = mcp_init_tools[0]
+        assert tool is not None
         assert "Initialize MCP configuration" in tool["description"]
         assert "inputSchema" in tool
 
-    def test_end_to_end_workflow(self):
+    def test_end_to_end_workflow(self, mcp_server, tmp_path):
         """Test complete end-to-end workflow."""
-        from hyper_cmd.mcp_server import MCPServer
-
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            # 1. Execute init-mcp via MCP server
-            server = MCPServer()
-
-            request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/call",
-                "params": {
-                    "name": "hyper_init-mcp",
-                    "arguments": {"force": True, "config_path": tmp_dir},
-                },
-            }
+        # 1. Execute init-mcp via MCP server
+        request = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {
+                "name": "hyper_init-mcp",
+                "arguments": {"force": True, "config_path": str(tmp_path)},
+            },
+        }
 
-            response = server.handle_request(request)
+        response = mcp_server.handle_request(request)
 
-            # 2. Verify MCP response
-            assert response["jsonrpc"] == "2.0"
-            assert response["id"] == 1
-            assert "result" in response
-            assert "isError" not in response["result"]
+        # 2. Verify MCP response
+        assert response["jsonrpc"] == "2.0"
+        assert response["id"] == 1
+        assert "result" in response
+        assert "isError" not in response["result"]
 
-            # 3. Verify config file was created
-            config_file = Path(tmp_dir) / ".mcp.json"
-            assert config_file.exists()
+        # 3. Verify config file was created
+        config_file = tmp_path / ".mcp.json"
+        assert config_file.exists()
 
-            # 4. Verify config content
-            with open(config_file) as f:
-                config = json.load(f)
+        # 4. Verify config content
+        with open(config_file) as f:
+            config = json.load(f)
 
-            assert "mcpServers" in config
-            assert "hyper-cmd" in config["mcpServers"]
-            assert config["mcpServers"]["hyper-cmd"]["command"] == "uvx"
+        assert "mcpServers" in config
+        assert "hyper-cmd" in config["mcpServers"]
+        assert config["mcpServers"]["hyper-cmd"]["command"] == "uvx"
@@ -276,6 +276,43 @@ class TestMCPServer:
         assert "hyper_safe" in tool_names
         assert "hyper_interactive" not in tool_names
 
+    def test_get_tool(self):
+        """Test single tool lookup by name."""
+        tool = self.server.get_tool("hyper_safe")
+
+        assert tool is not None
+        assert tool["name"] == "hyper_safe"
+        assert self.server.get_tool("hyper_interactive") is None
+        assert self.server.get_tool("hyper_missing") is None
+
+    def test_get_tools_built_once(self):
+        """Test tool schemas are built once per server."""
+        with patch.object(
+            self.server, "_iter_tool_schemas", wraps=self.server._iter_tool_schemas
+        ) as mock_build:
+            self.server.get_tools()
+            self.server.get_tools()
+            self.server.get_tool("hyper_safe")
+
+        assert mock_build.call_count == 1
+
+    def test_iter_tools(self):
+        """Test lazy tool iteration matches the full tool list."""
+        assert list(self.server.iter_tools()) == self.server.get_tools()
+
+    def test_iter_tools_stops_early(self):
+        """Test that stopping iteration early skips analyzing remaining commands."""
+        with patch.object(
+            self.server.command_analyzer,
+            "get_tool_schema",
+            wraps=self.server.command_analyzer.get_tool_schema,
+        ) as mock_schema:
+            tool = next(self.server.iter_tools())
+
+        assert tool["name"] == "hyper_safe"
+        assert mock_schema.call_count == 1
+        self.server.registry.get.assert_called_once_with("safe")
+
     def test_get_command_info(self):
         """Test comprehensive command information."""
         info = self.server.get_command_info()